@@ -34,10 +34,12 @@
 import json
 import numpy as np
 import pandas as pd
-from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 import matplotlib.pyplot as plt
 import seaborn as sns
+from skill_gap.categories import get_category_index
+from skill_gap.embeddings import get_embedder, load_model
+from skill_gap.model_compare import comparison_table, compare_models
 
 ABBREVIATIONS = {
     "ml": "machine learning",
@@ -59,20 +61,22 @@ def build_skill_dict(resume_skills, jd_skills):
     }
 
 
-# 4, 21: Load Sentence-BERT models
-model_a = SentenceTransformer("all-MiniLM-L6-v2")
-model_b = SentenceTransformer("paraphrase-MiniLM-L12-v2")
+# 4: Load Sentence-BERT model (the offline artifact when SKILL_GAP_ARTIFACT is
+# set; the second model for 21 is loaded on demand by compare_models)
+model_a = load_model()
 
 
 #5–7, 22: Embedding generation with caching
 
+# One cache per model, so vectors from different models never mix
 embedding_cache = {}
 def embed_skills(skills, model):
+    cache = embedding_cache.setdefault(model, {})
     embeddings = []
     for skill in skills:
-        if skill not in embedding_cache:
-            embedding_cache[skill] = model.encode(skill)
-        embeddings.append(embedding_cache[skill])
+        if skill not in cache:
+            cache[skill] = model.encode(skill)
+        embeddings.append(cache[skill])
     return np.array(embeddings)
 
 
@@ -94,24 +98,25 @@ def best_matches(df, top_n=3):
 
 
 # 13, 25: Threshold-based classification
+# Thresholds may be scalars or one value per JD skill (see category_thresholds)
 def classify_skills(df, tech_threshold=0.75, partial_threshold=0.5):
-    matched, partial, missing = [], [], []
+    max_scores = df.max(axis=0)
+    matched = max_scores >= tech_threshold
+    partial = ~matched & (max_scores >= partial_threshold)
+    missing = ~matched & ~partial
 
-    for jd in df.columns:
-        max_score = df[jd].max()
-        if max_score >= tech_threshold:
-            matched.append(jd)
-        elif max_score >= partial_threshold:
-            partial.append(jd)
-        else:
-            missing.append(jd)
+    return list(df.columns[matched]), list(df.columns[partial]), list(df.columns[missing])
+
+# Technical and soft skills get their own thresholds via the category index
+category_index = get_category_index(get_embedder())
 
-    return matched, partial, missing
+def category_thresholds(jd_skills):
+    return category_index.thresholds(jd_skills)
 
 
 # 14–15: Skill gap report & JSON export
 def skill_gap_report(df):
-    matched, partial, missing = classify_skills(df)
+    matched, partial, missing = classify_skills(df, *category_thresholds(df.columns))
     return {
         "matched_skills": matched,
         "partially_matched_skills": partial,
@@ -167,3 +172,10 @@ print("Alignment Score:", result["alignment_score"])
 
 plot_heatmap(result["similarity_matrix"])
 save_report(result["skill_gap_report"])
+
+# 21: Compare both models side by side (the second model comes from the hub,
+# so this needs network access unless COMPARE_MODELS lists artifact directories)
+comparison = compare_models(resume, jd, category_index=category_index)
+print(comparison_table(comparison))
+for agreement in comparison["agreement"]:
+    print("Classification flips:", agreement["classification_flips"])
@@ -15,10 +15,12 @@
 # 15. Build a complete Streamlit dashboard that performs upload, analysis, visualization, and report
 # export end-to-end.
 
+import time
 import streamlit as st
 import pandas as pd
-import numpy as np
-import io
+
+from skill_gap.analysis import Progress, submit_analysis
+from skill_gap.extraction import SUPPORTED_FORMATS
 
 # -------------------------------
 # 1. Title and Description
@@ -48,21 +50,35 @@ if "results" not in st.session_state:
 # -------------------------------
 # Helper Function
 # -------------------------------
-def read_text(file):
-    return file.read().decode("utf-8")
+def run_analysis(resume_file, jd_file):
+    # Heavy work runs in the shared background executor; this loop only
+    # redraws the progress bar until the result is ready.
+    progress = Progress()
+    future = submit_analysis(
+        resume_file.getvalue(), resume_file.name,
+        jd_file.getvalue(), jd_file.name,
+        progress=progress
+    )
+    bar = st.progress(0.0, text="Queued")
+    while not future.done():
+        stage, fraction = progress.snapshot()
+        bar.progress(fraction, text=stage)
+        time.sleep(0.1)
+    bar.empty()
+    return future.result()
 
 # -------------------------------
 # 3. File Uploaders
 # -------------------------------
 resume_file = st.file_uploader(
     "Upload Resume",
-    type=["pdf", "docx", "txt"],
+    type=SUPPORTED_FORMATS,
     key="resume"
 )
 
 jd_file = st.file_uploader(
     "Upload Job Description",
-    type=["pdf", "docx", "txt"],
+    type=SUPPORTED_FORMATS,
     key="jd"
 )
 
@@ -83,10 +99,18 @@ if st.button("Process Files"):
         st.error("Please upload both resume and job description files.")
     else:
         try:
-            st.session_state.resume_text = read_text(resume_file)
-            st.session_state.jd_text = read_text(jd_file)
-        except:
+            result = run_analysis(resume_file, jd_file)
+        except ValueError as e:
+            st.error(str(e))
+        except Exception:
             st.error("Unsupported or corrupted file format.")
+        else:
+            st.session_state.resume_text = result["resume_text"]
+            st.session_state.jd_text = result["jd_text"]
+            # Compact SkillGapResult; tables are rebuilt from it when drawn
+            st.session_state.results = result.get("result")
+            if "error" in result:
+                st.warning("No known skills were found in the job description.")
 
 # -------------------------------
 # 5 & 7. Preview Sections
@@ -104,20 +128,14 @@ with col2:
 # -------------------------------
 # 8–11. Skill Analysis
 # -------------------------------
-if st.session_state.resume_text and st.session_state.jd_text:
-
-    skills_master = [
-        "python", "sql", "machine learning", "data analysis",
-        "flask", "django", "aws", "excel", "communication"
-    ]
-
-    resume_skills = [s for s in skills_master if s in st.session_state.resume_text.lower()]
-    jd_skills = [s for s in skills_master if s in st.session_state.jd_text.lower()]
+results = st.session_state.results
 
-    matched_skills = list(set(resume_skills) & set(jd_skills))
-    missing_skills = list(set(jd_skills) - set(resume_skills))
+if results:
+    matched_skills = results.matched_skills
+    partial_skills = results.partial_skills
+    missing_skills = results.missing_skills
 
-    match_percentage = int((len(matched_skills) / max(len(jd_skills), 1)) * 100)
+    match_percentage = int((len(matched_skills) / max(len(results.jd_ids), 1)) * 100)
 
     # -------------------------------
     # 8. Metric
@@ -127,13 +145,17 @@ if st.session_state.resume_text and st.session_state.jd_text:
     # -------------------------------
     # 9. Matched & Missing Skills
     # -------------------------------
-    col3, col4 = st.columns(2)
+    col3, col4, col5 = st.columns(3)
 
     with col3:
         st.subheader("Matched Skills")
         st.write(matched_skills)
 
     with col4:
+        st.subheader("Partially Matched Skills")
+        st.write(partial_skills)
+
+    with col5:
         st.subheader("Missing Skills")
         st.write(missing_skills)
 
@@ -141,30 +163,19 @@ if st.session_state.resume_text and st.session_state.jd_text:
     # 10. Bar Chart
     # -------------------------------
     chart_data = pd.DataFrame({
-        "Category": ["Matched Skills", "Missing Skills"],
-        "Count": [len(matched_skills), len(missing_skills)]
+        "Category": ["Matched Skills", "Partially Matched Skills", "Missing Skills"],
+        "Count": [len(matched_skills), len(partial_skills), len(missing_skills)]
     })
     st.bar_chart(chart_data.set_index("Category"))
 
     # -------------------------------
-    # 11. Similarity Table (Mock Scores)
+    # 11. Similarity Table
     # -------------------------------
-    similarity_data = []
-    for skill in jd_skills:
-        score = 1.0 if skill in matched_skills else round(np.random.uniform(0.2, 0.6), 2)
-        similarity_data.append([skill, score])
-
-    df_similarity = pd.DataFrame(
-        similarity_data,
-        columns=["Skill", "Similarity Score"]
-    )
+    df_similarity = results.to_scores_table()
 
     st.subheader("Skill Similarity Scores")
     st.dataframe(df_similarity)
 
-    # Store results
-    st.session_state.results = df_similarity
-
     # -------------------------------
     # 14. Download CSV
     # -------------------------------
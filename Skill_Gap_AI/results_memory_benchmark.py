@@ -0,0 +1,90 @@
+# Memory benchmark: dict-of-DataFrame pipeline results vs compact SkillGapResult.
+#
+# Builds the same N skill gap results in both forms and measures what stays
+# allocated with tracemalloc. Embeddings are random unit vectors seeded into
+# the embedder cache, so no model is needed and only result storage is measured.
+#
+#   python results_memory_benchmark.py --n 10000
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import numpy as np
+
+from skill_gap.embeddings import SkillEmbedder
+from skill_gap.results import SkillVocab, compact_pipeline
+from skill_gap.scoring import skill_gap_pipeline
+
+
+class NoModel:
+    def get_sentence_embedding_dimension(self):
+        return 384
+
+    def encode(self, *args, **kwargs):
+        raise RuntimeError("benchmark embeddings are precomputed")
+
+
+def make_workloads(n, vocab_size, resume_len, jd_len, seed=0):
+    rng = np.random.default_rng(seed)
+    skills = [f"skill {i}" for i in range(vocab_size)]
+    workloads = [
+        (list(rng.choice(skills, resume_len, replace=False)),
+         list(rng.choice(skills, jd_len, replace=False)))
+        for _ in range(n)
+    ]
+
+    emb = rng.normal(size=(vocab_size, 384)).astype(np.float32)
+    emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+    embedder = SkillEmbedder(NoModel())
+    embedder.cache.update(zip(skills, emb))
+    return workloads, embedder
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return results, size, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=10000)
+    parser.add_argument("--vocab-size", type=int, default=2000)
+    parser.add_argument("--resume-skills", type=int, default=15)
+    parser.add_argument("--jd-skills", type=int, default=10)
+    args = parser.parse_args()
+
+    workloads, embedder = make_workloads(args.n, args.vocab_size, args.resume_skills, args.jd_skills)
+
+    dicts, dict_bytes, dict_s = measure(
+        lambda: [skill_gap_pipeline(r, j, embedder) for r, j in workloads]
+    )
+    del dicts
+
+    vocab = SkillVocab()
+    compact, compact_bytes, compact_s = measure(
+        lambda: [compact_pipeline(r, j, embedder, vocab) for r, j in workloads]
+    )
+    del compact
+
+    print(f"{args.n} results, {args.resume_skills} resume x {args.jd_skills} JD skills each")
+    print(f"{'form':<20}{'total MB':>10}{'bytes/result':>14}{'MB @50k':>10}{'build s':>10}")
+    for name, size, elapsed in [
+        ("dict-of-DataFrame", dict_bytes, dict_s),
+        ("SkillGapResult", compact_bytes, compact_s)
+    ]:
+        per = size / args.n
+        print(f"{name:<20}{size / 1e6:>10.1f}{per:>14.0f}{per * 50000 / 1e6:>10.1f}{elapsed:>10.2f}")
+    print(f"reduction: {dict_bytes / max(compact_bytes, 1):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
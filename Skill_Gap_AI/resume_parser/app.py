@@ -1,12 +1,19 @@
+import os
+import sys
+import time
 import streamlit as st
 import pandas as pd
-import pdfplumber
-import docx
 import numpy as np
 import matplotlib.pyplot as plt
 import plotly.graph_objects as go
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from skill_gap.catalogue import load_catalogue
+from skill_gap.categories import get_category_index
+from skill_gap.embeddings import get_embedder
+from skill_gap.extraction import SUPPORTED_FORMATS, extract_text
+from skill_gap.results import SkillVocab, compact_pipeline
+from skill_gap.skills import find_skills
 
 # ---------------- CONFIG ----------------
 st.set_page_config(page_title="Skill Gap Analysis Dashboard", layout="wide")
@@ -17,10 +24,19 @@ with open("static/style.css") as f:
 
 # ---------------- MODEL ----------------
 @st.cache_resource
-def load_model():
-    return SentenceTransformer("all-MiniLM-L6-v2")
+def load_embedder():
+    start = time.perf_counter()
+    embedder = get_embedder()
+    return embedder, time.perf_counter() - start
+
+embedder, startup_s = load_embedder()
+category_index = get_category_index(embedder)
 
-model = load_model()
+JD_CATALOGUE_PATH = "data/jd_catalogue.json"
+
+@st.cache_resource
+def get_catalogue():
+    return load_catalogue(JD_CATALOGUE_PATH, embedder, category_index=category_index)
 
 
 # ---------------- JD SKILLS ----------------
@@ -35,24 +51,22 @@ JD_SKILLS = [
 ]
 
 # ---------------- UTILS ----------------
-def extract_text(file):
-    if file.name.endswith(".pdf"):
-        with pdfplumber.open(file) as pdf:
-            return " ".join(p.extract_text() for p in pdf.pages if p.extract_text())
-    elif file.name.endswith(".docx"):
-        doc = docx.Document(file)
-        return " ".join(p.text for p in doc.paragraphs)
-    elif file.name.endswith(".txt"):
-        return file.read().decode("utf-8")
-    return ""
-
-def radar_chart(matched_skills):
+def read_upload(file):
+    try:
+        return extract_text(file.getvalue(), file.name)
+    except ValueError as e:
+        st.error(str(e))
+        st.stop()
+
+def radar_chart(category_match):
     categories = ["Technical", "Soft Skills", "Experience", "Education", "Certifications"]
 
-   
+    # Share of matched JD skills per category, scaled onto the chart
+    technical = np.nan_to_num(category_match["technical"])
+    soft = np.nan_to_num(category_match["soft"])
     resume_scores = [
-        5 if any(s in matched_skills for s in ["Python", "Machine Learning", "SQL"]) else 1.5,
-        4.5 if "Communication" in matched_skills else 1.5,
+        1.5 + 3.5 * technical,
+        1.5 + 3 * soft,
         2.5, 
         2.5,  
         2     
@@ -122,34 +136,51 @@ def skill_progress(skill, value):
 
 # ---------------- SIDEBAR ----------------
 st.sidebar.title("Skill Gap AI")
-file = st.sidebar.file_uploader("Upload Resume", ["pdf", "docx", "txt"])
+mode = st.sidebar.radio("Mode", ["Single JD", "Multi-JD"])
+file = st.sidebar.file_uploader("Upload Resume", SUPPORTED_FORMATS)
+st.sidebar.caption(f"Model ready in {startup_s:.1f}s")
 
 # ---------------- MAIN ----------------
 st.markdown("<h2>Skill Gap Analysis Dashboard</h2>", unsafe_allow_html=True)
 
-if file:
-    text = extract_text(file)
+if file and mode == "Multi-JD":
+    text = read_upload(file)
+    catalogue = get_catalogue()
+
+    start = time.perf_counter()
+    ranking = catalogue.rank_text(text)
+    elapsed = time.perf_counter() - start
+
+    st.subheader(f"Ranked Openings ({len(catalogue)} roles)")
+    st.caption(f"Scored against all openings in {elapsed * 1000:.1f} ms")
+    st.dataframe(ranking, use_container_width=True, hide_index=True)
+
+    st.download_button(
+        "Download Ranking CSV",
+        ranking.to_csv(index=False),
+        "jd_ranking.csv",
+        "text/csv"
+    )
 
-    resume_skills = [s for s in JD_SKILLS if s.lower() in text.lower()]
+elif file:
+    text = read_upload(file)
 
-    res_emb = model.encode(resume_skills)
-    jd_emb = model.encode(JD_SKILLS)
-    similarity = cosine_similarity(res_emb, jd_emb)
+    # Same scoring and classification as the milestone 4 dashboard
+    result = compact_pipeline(
+        find_skills(text, JD_SKILLS), JD_SKILLS, embedder, SkillVocab(), category_index
+    )
+    scores = result.best_scores
+    is_matched, is_partial = result.category_masks()
 
-    matched, missing = [], []
-    for i, skill in enumerate(JD_SKILLS):
-        if similarity[:, i].max() >= 0.5:
-            matched.append(skill)
-        else:
-            missing.append(skill)
+    skills = np.array(JD_SKILLS)
+    matched = skills[is_matched].tolist()
+    partial = skills[is_partial].tolist()
+    missing = skills[~is_matched & ~is_partial].tolist()
 
     match_percentage = int((len(matched) / len(JD_SKILLS)) * 100)
 
     # ---------------- BAR CHART ----------------
-    resume_scores = []
-    for i, skill in enumerate(JD_SKILLS):
-        score = similarity[:, i].max() if resume_skills else 0
-        resume_scores.append(int(score * 100))
+    resume_scores = np.rint(scores * 100).astype(int).tolist()
 
     jd_scores = [100 for _ in JD_SKILLS]
 
@@ -167,7 +198,7 @@ if file:
     st.plotly_chart(fig, use_container_width=True)
 
     # ---------------- METRICS ----------------
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
 
     col1.markdown(
         f"<div class='metric-card'><div class='metric-title'>Overall Match</div><div class='metric-value'>{match_percentage}%</div></div>",
@@ -178,6 +209,10 @@ if file:
         unsafe_allow_html=True
     )
     col3.markdown(
+        f"<div class='metric-card'><div class='metric-title'>Partially Matched</div><div class='metric-value'>{len(partial)}</div></div>",
+        unsafe_allow_html=True
+    )
+    col4.markdown(
         f"<div class='metric-card'><div class='metric-title'>Missing Skills</div><div class='metric-value'>{len(missing)}</div></div>",
         unsafe_allow_html=True
     )
@@ -187,25 +222,31 @@ if file:
     for s in matched:
         st.markdown(f"<span class='skill-chip match'>{s}</span>", unsafe_allow_html=True)
 
+    st.subheader("Partially Matched Skills")
+    for s in partial:
+        st.markdown(f"<span class='skill-chip partial'>{s}</span>", unsafe_allow_html=True)
+
     st.subheader("Missing Skills")
     for s in missing:
         st.markdown(f"<span class='skill-chip miss'>{s}</span>", unsafe_allow_html=True)
 
     # ---------------- SKILL COMPARISON ----------------
     st.subheader("Skill Comparison")
-    skill_progress("Python", int(similarity[:, JD_SKILLS.index("Python")].max() * 100))
-    skill_progress("Machine Learning", int(similarity[:, JD_SKILLS.index("Machine Learning")].max() * 100))
-    skill_progress("SQL", int(similarity[:, JD_SKILLS.index("SQL")].max() * 100))
-    skill_progress("AWS", int(similarity[:, JD_SKILLS.index("AWS")].max() * 100))
+    skill_progress("Python", round(float(scores[JD_SKILLS.index("Python")]) * 100))
+    skill_progress("Machine Learning", round(float(scores[JD_SKILLS.index("Machine Learning")]) * 100))
+    skill_progress("SQL", round(float(scores[JD_SKILLS.index("SQL")]) * 100))
+    skill_progress("AWS", round(float(scores[JD_SKILLS.index("AWS")]) * 100))
 
     # ---------------- RADAR CHART ----------------
     st.subheader("Profile Match Overview")
-    st.pyplot(radar_chart(matched))
+    # Partial matches count half towards their category
+    st.pyplot(radar_chart(category_index.category_match(JD_SKILLS, is_matched + 0.5 * is_partial)))
 
     # ---------------- CSV EXPORT ----------------
-    max_len = max(len(matched), len(missing))
+    max_len = max(len(matched), len(partial), len(missing))
     df = pd.DataFrame({
         "Matched Skills": matched + [""] * (max_len - len(matched)),
+        "Partially Matched Skills": partial + [""] * (max_len - len(partial)),
         "Missing Skills": missing + [""] * (max_len - len(missing))
     })
 
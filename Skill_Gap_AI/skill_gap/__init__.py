@@ -0,0 +1 @@
+# Shared skill gap analysis backend used by the Streamlit dashboards.
@@ -0,0 +1,78 @@
+# End-to-end document analysis, runnable in a background executor.
+#
+# The dashboard submits analyze_documents() to a shared thread pool and
+# polls the Progress object from the UI thread, so long PDF extraction or
+# embedding never blocks the page.
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from .categories import get_category_index
+from .embeddings import get_embedder
+from .extraction import extract_text
+from .results import SkillVocab, compact_pipeline
+from .skills import DEFAULT_SKILLS, find_skills
+
+# Shared by every analysis in the process, so results only store int ids
+_vocab = SkillVocab()
+
+
+class Progress:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stage = "Queued"
+        self.fraction = 0.0
+
+    def update(self, stage, fraction):
+        with self._lock:
+            self.stage = stage
+            self.fraction = min(max(fraction, 0.0), 1.0)
+
+    def snapshot(self):
+        with self._lock:
+            return self.stage, self.fraction
+
+
+@lru_cache(maxsize=None)
+def get_executor(max_workers=2):
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="skill-gap")
+
+
+def _stage(progress, stage, start, end):
+    # Maps an extractor's (done, total) callback onto a slice of the bar
+    def report(done, total):
+        progress.update(stage, start + (end - start) * done / max(total, 1))
+    return report
+
+
+def analyze_documents(resume_data, resume_name, jd_data, jd_name,
+                      skills=DEFAULT_SKILLS, embedder=None, progress=None):
+    progress = progress or Progress()
+
+    resume_text = extract_text(resume_data, resume_name, _stage(progress, "Reading resume", 0.0, 0.4))
+    jd_text = extract_text(jd_data, jd_name, _stage(progress, "Reading job description", 0.4, 0.8))
+
+    progress.update("Scoring skills", 0.8)
+    resume_skills = find_skills(resume_text, skills)
+    jd_skills = find_skills(jd_text, skills)
+    result = {
+        "resume_text": resume_text,
+        "jd_text": jd_text,
+        "resume_skills": resume_skills,
+        "jd_skills": jd_skills
+    }
+    embedder = embedder or get_embedder()
+    try:
+        result["result"] = compact_pipeline(
+            resume_skills, jd_skills, embedder, _vocab, get_category_index(embedder)
+        )
+    except ValueError as e:
+        result["error"] = str(e)
+
+    progress.update("Done", 1.0)
+    return result
+
+
+def submit_analysis(*args, **kwargs):
+    return get_executor().submit(analyze_documents, *args, **kwargs)
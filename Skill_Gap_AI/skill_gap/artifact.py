@@ -0,0 +1,151 @@
+# Offline model artifacts: weights, tokenizer and taxonomy embeddings in one
+# directory, loadable without network access.
+#
+#   <artifact>/
+#       manifest.json      model name, embedding dimension, taxonomy size
+#       model/             SentenceTransformer.save() output (safetensors
+#                          weights, tokenizer, config)
+#       taxonomy.json      skill names, row order of taxonomy.npy
+#       taxonomy.npy       float32, L2-normalized taxonomy embeddings
+#
+# Weights are stored as safetensors, which are read through a memory map,
+# and taxonomy.npy is opened with mmap_mode="r", so its rows stay file-backed
+# and pages are shared between replicas on the same host.
+#
+#   python -m skill_gap.artifact export models/minilm --catalogue resume_parser/data/jd_catalogue.json
+#   python -m skill_gap.artifact check models/minilm
+#
+# Setting SKILL_GAP_ARTIFACT=/abs/path/to/models/minilm makes load_model() and
+# get_embedder() use the artifact by default. Prefer an absolute path:
+# resume_parser/app.py runs from resume_parser/, so a relative one resolves
+# against that directory.
+#
+# Loading passes local_files_only=True, so an artifact never reaches the hub;
+# the process environment is left untouched, so hub models can still be
+# loaded next to it (e.g. by model_compare).
+
+import argparse
+import json
+import os
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from .categories import CATEGORY_SKILLS
+from .skills import ABBREVIATIONS, DEFAULT_SKILLS, clean_skills
+
+MANIFEST = "manifest.json"
+ARTIFACT_FORMAT = 1
+
+
+def is_artifact(path):
+    return os.path.isfile(os.path.join(path, MANIFEST))
+
+
+def taxonomy_skills(catalogue_path=None):
+    skills = [s for group in CATEGORY_SKILLS.values() for s in group]
+    skills += DEFAULT_SKILLS + list(ABBREVIATIONS.values())
+    if catalogue_path:
+        from .catalogue import load_jds
+
+        skills += [s for _, jd_skills in load_jds(catalogue_path) for s in jd_skills]
+    return clean_skills(skills)
+
+
+# ---------------- EXPORT ----------------
+def export_artifact(model_name, path, catalogue_path=None):
+    from sentence_transformers import SentenceTransformer
+
+    os.makedirs(path, exist_ok=True)
+    model = SentenceTransformer(model_name, device="cpu")
+    model.save(os.path.join(path, "model"), safe_serialization=True)
+
+    skills = taxonomy_skills(catalogue_path)
+    table = model.encode(skills, batch_size=64, normalize_embeddings=True, convert_to_numpy=True)
+    np.save(os.path.join(path, "taxonomy.npy"), table.astype(np.float32))
+    with open(os.path.join(path, "taxonomy.json"), "w") as f:
+        json.dump(skills, f)
+
+    manifest = {
+        "format": ARTIFACT_FORMAT,
+        "model_name": model_name,
+        "embedding_dimension": int(table.shape[1]),
+        "taxonomy_size": len(skills)
+    }
+    with open(os.path.join(path, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=4)
+    return manifest
+
+
+# ---------------- LOAD ----------------
+class ModelArtifact:
+    def __init__(self, path, manifest, model, embedder, timings):
+        self.path = path
+        self.manifest = manifest
+        self.model = model
+        self.embedder = embedder
+        self.timings = timings
+
+
+@lru_cache(maxsize=None)
+def load_artifact(path, warmup=True):
+    from .embeddings import SkillEmbedder
+
+    timings = {}
+    start = time.perf_counter()
+
+    with open(os.path.join(path, MANIFEST)) as f:
+        manifest = json.load(f)
+    if manifest.get("format") != ARTIFACT_FORMAT:
+        raise ValueError(f"Unsupported artifact format in {path}: {manifest.get('format')}")
+
+    step = time.perf_counter()
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(os.path.join(path, "model"), device="cpu", local_files_only=True)
+    timings["model_s"] = time.perf_counter() - step
+
+    step = time.perf_counter()
+    table = np.load(os.path.join(path, "taxonomy.npy"), mmap_mode="r")
+    with open(os.path.join(path, "taxonomy.json")) as f:
+        skills = json.load(f)
+    embedder = SkillEmbedder(model, name=os.path.abspath(path))
+    embedder.cache.update(zip(skills, table))
+    timings["taxonomy_s"] = time.perf_counter() - step
+
+    if warmup:
+        # First encode call pays for lazy kernel/tokenizer setup; do it now
+        step = time.perf_counter()
+        model.encode(["warmup"], convert_to_numpy=True)
+        timings["warmup_s"] = time.perf_counter() - step
+
+    timings["total_s"] = time.perf_counter() - start
+    return ModelArtifact(path, manifest, model, embedder, timings)
+
+
+# ---------------- CLI ----------------
+def main():
+    parser = argparse.ArgumentParser(description="Build or check an offline model artifact.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export = sub.add_parser("export", help="download a model and write an artifact")
+    export.add_argument("path")
+    export.add_argument("--model", default="all-MiniLM-L6-v2")
+    export.add_argument("--catalogue", help="JD catalogue whose skills join the taxonomy")
+
+    check = sub.add_parser("check", help="load an artifact offline and report startup time")
+    check.add_argument("path")
+
+    args = parser.parse_args()
+    if args.command == "export":
+        manifest = export_artifact(args.model, args.path, args.catalogue)
+        print(f"Wrote {args.path}: {manifest['model_name']}, {manifest['taxonomy_size']} taxonomy skills")
+    else:
+        artifact = load_artifact(args.path)
+        for name, seconds in artifact.timings.items():
+            print(f"{name:<12}{seconds:8.3f}")
+
+
+if __name__ == "__main__":
+    main()
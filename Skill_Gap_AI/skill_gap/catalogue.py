@@ -0,0 +1,172 @@
+# Multi-JD catalogue: score one resume against every opening at once.
+#
+# The catalogue is a JSON list of {"title": ..., "skills": [...]} entries.
+# All JD skills are pooled into one vocabulary which is embedded a single
+# time through the shared embedder (so rows precomputed into an offline
+# artifact are reused) and cached next to the catalogue file
+# (<catalogue>.npz), keyed by the embedder's model name. Each JD is
+# stored as a padded row of vocabulary ids, so scoring a resume is:
+#
+#   best  = max over resume skills of (resume_emb @ vocab_emb.T)   -> (V,)
+#   score = best[jd_index]                                         -> (J, L)
+#
+# i.e. one matrix product plus one gather for the whole catalogue.
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from .scoring import PARTIAL_THRESHOLD, TECH_THRESHOLD, classify_scores, skill_thresholds
+from .skills import ABBREVIATIONS, normalize_skill, normalize_text, skill_pattern
+
+
+def load_jds(path):
+    with open(path) as f:
+        jds = json.load(f)
+    return [(jd["title"], jd["skills"]) for jd in jds if jd.get("skills")]
+
+
+# ---------------- EMBEDDING CACHE ----------------
+def _cache_path(path):
+    return os.path.splitext(path)[0] + ".npz"
+
+
+def _load_cached_embeddings(path, vocab, model_name):
+    cache = _cache_path(path)
+    if not os.path.exists(cache):
+        return None
+    with np.load(cache, allow_pickle=False) as data:
+        if str(data["model_name"]) != model_name or list(data["vocab"]) != vocab:
+            return None
+        return data["embeddings"]
+
+
+def _save_cached_embeddings(path, vocab, model_name, embeddings):
+    # The cache is an optimization; a read-only deploy directory just skips it
+    try:
+        np.savez(
+            _cache_path(path),
+            vocab=np.array(vocab),
+            model_name=np.array(model_name),
+            embeddings=embeddings
+        )
+    except OSError:
+        pass
+
+
+# ---------------- CATALOGUE ----------------
+class JDCatalogue:
+    def __init__(self, titles, jd_skills, vocab, labels, embeddings,
+                 tech_thresholds=TECH_THRESHOLD, partial_thresholds=PARTIAL_THRESHOLD):
+        self.titles = titles
+        self.vocab = vocab
+        self.labels = labels
+        self.embeddings = embeddings.astype(np.float32)
+        self.vocab_ids = {s: i for i, s in enumerate(vocab)}
+
+        rows = [
+            list(dict.fromkeys(self.vocab_ids[normalize_skill(s)] for s in skills))
+            for skills in jd_skills
+        ]
+        width = max(len(r) for r in rows)
+        self.index = np.zeros((len(rows), width), dtype=np.int64)
+        self.mask = np.zeros((len(rows), width), dtype=bool)
+        for i, r in enumerate(rows):
+            self.index[i, :len(r)] = r
+            self.mask[i, :len(r)] = True
+        self.lengths = self.mask.sum(axis=1)
+
+        # Scalars or one cut-off per vocabulary skill, gathered into JD layout once
+        self.jd_thresholds = tuple(
+            np.broadcast_to(np.asarray(t, dtype=np.float32), (len(vocab),))[self.index]
+            for t in (tech_thresholds, partial_thresholds)
+        )
+
+        # Abbreviations such as "ML" count towards the skill they expand to,
+        # as in skills.find_skills
+        aliases = [a for a, s in ABBREVIATIONS.items() if s in self.vocab_ids]
+        self._pattern = skill_pattern(vocab + aliases)
+
+    def __len__(self):
+        return len(self.titles)
+
+    def extract_skill_ids(self, text):
+        found = {normalize_skill(m) for m in self._pattern.findall(normalize_text(text))}
+        return np.array(sorted(self.vocab_ids[s] for s in found), dtype=np.int64)
+
+    def best_scores(self, resume_emb):
+        if len(resume_emb) == 0:
+            return np.zeros(len(self.vocab), dtype=np.float32)
+        return (resume_emb @ self.embeddings.T).max(axis=0)
+
+    def score(self, resume_emb, thresholds=None):
+        # Same matched/partial rule as scoring.classify_scores; Match % only
+        # counts full matches
+        tech, partial = thresholds or self.jd_thresholds
+        best = self.best_scores(resume_emb)
+        scores = np.where(self.mask, best[self.index], 0.0)
+        matched, partial = classify_scores(scores, tech, partial)
+        matched &= self.mask
+        partial &= self.mask
+        match_pct = matched.sum(axis=1) / self.lengths * 100
+        alignment = scores.sum(axis=1) / self.lengths
+        return scores, matched, partial, match_pct, alignment
+
+    def rank(self, resume_emb, thresholds=None, top_n=None):
+        _, matched, partial, match_pct, alignment = self.score(resume_emb, thresholds)
+
+        order = np.lexsort((-alignment, -match_pct))
+        if top_n is not None:
+            order = order[:top_n]
+
+        rows = []
+        for j in order:
+            ids = self.index[j, self.mask[j]]
+            hit = matched[j, self.mask[j]]
+            near = partial[j, self.mask[j]]
+            rows.append({
+                "Role": self.titles[j],
+                "Match %": int(match_pct[j]),
+                "Alignment": round(float(alignment[j]), 3),
+                "Matched Skills": ", ".join(self.labels[i] for i in ids[hit]),
+                "Partially Matched Skills": ", ".join(self.labels[i] for i in ids[near]),
+                "Missing Skills": ", ".join(self.labels[i] for i in ids[~hit & ~near])
+            })
+        return pd.DataFrame(rows)
+
+    def rank_text(self, text, thresholds=None, top_n=None):
+        # Resume skills found in the catalogue vocabulary reuse the
+        # precomputed rows, so no model call is needed at query time.
+        ids = self.extract_skill_ids(text)
+        return self.rank(self.embeddings[ids], thresholds, top_n)
+
+
+def load_catalogue(path, embedder, category_index=None):
+    jds = load_jds(path)
+    if not jds:
+        raise ValueError(f"JD catalogue {path} has no entries with skills")
+    titles = [title for title, _ in jds]
+    jd_skills = [skills for _, skills in jds]
+
+    labels = {}
+    for skills in jd_skills:
+        for s in skills:
+            labels.setdefault(normalize_skill(s), s.strip())
+    vocab = list(labels)
+
+    # Unnamed embedders can't be told apart on disk, so they skip the file cache
+    embeddings = None
+    if embedder.name is not None:
+        embeddings = _load_cached_embeddings(path, vocab, embedder.name)
+    if embeddings is None:
+        embeddings = embedder.embed(vocab)
+        if embedder.name is not None:
+            _save_cached_embeddings(path, vocab, embedder.name, embeddings)
+
+    # Per-category (matched, partial) cut-offs, as compact_pipeline applies
+    # them in the single-JD dashboard
+    tech, partial = skill_thresholds(vocab, category_index)
+
+    return JDCatalogue(titles, jd_skills, vocab, list(labels.values()), embeddings, tech, partial)
@@ -0,0 +1,94 @@
+# Skill category index with per-category similarity thresholds.
+#
+# Known skills are mapped to a category by lookup; any other skill goes to
+# the category whose centroid (mean of its known skill embeddings) is
+# nearest. Centroids are computed once per embedder and every assignment is
+# memoized, so classification only gathers threshold arrays by category id.
+
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+from .skills import clean_skills, normalize_skill
+
+CATEGORY_SKILLS = {
+    "technical": [
+        "python", "java", "javascript", "typescript", "c++", "sql", "nosql",
+        "machine learning", "deep learning", "artificial intelligence",
+        "natural language processing", "data analysis", "statistics",
+        "tensorflow", "pytorch", "spacy", "pandas", "numpy", "excel",
+        "tableau", "power bi", "spark", "airflow", "data modeling",
+        "flask", "django", "react", "node.js", "html", "css", "rest apis",
+        "aws", "azure", "docker", "kubernetes", "terraform", "linux",
+        "git", "ci/cd", "networking"
+    ],
+    "soft": [
+        "communication", "teamwork", "leadership", "problem solving",
+        "project management", "stakeholder management", "time management",
+        "critical thinking", "collaboration", "adaptability", "agile",
+        "presentation", "mentoring", "negotiation"
+    ]
+}
+
+# (matched, partially matched) cut-offs; soft skills are phrased far more
+# loosely than tool names, so they get lower thresholds
+CATEGORY_THRESHOLDS = {
+    "technical": (0.75, 0.5),
+    "soft": (0.6, 0.4)
+}
+
+
+class SkillCategoryIndex:
+    def __init__(self, embedder, category_skills=CATEGORY_SKILLS, thresholds=CATEGORY_THRESHOLDS):
+        self.embedder = embedder
+        self.categories = list(category_skills)
+        self.tech_thresholds = np.array([thresholds[c][0] for c in self.categories], dtype=np.float32)
+        self.partial_thresholds = np.array([thresholds[c][1] for c in self.categories], dtype=np.float32)
+
+        self._lookup = {
+            s: i for i, c in enumerate(self.categories) for s in clean_skills(category_skills[c])
+        }
+        self._centroids = None
+        self._lock = threading.Lock()
+
+    @property
+    def centroids(self):
+        if self._centroids is None:
+            skills = list(self._lookup)
+            ids = np.array(list(self._lookup.values()))
+            emb = self.embedder.embed(skills)
+            centroids = np.stack([emb[ids == i].mean(axis=0) for i in range(len(self.categories))])
+            self._centroids = centroids / np.linalg.norm(centroids, axis=1, keepdims=True)
+        return self._centroids
+
+    def category_ids(self, skills):
+        skills = [normalize_skill(s) for s in skills]
+        with self._lock:
+            unknown = list(dict.fromkeys(s for s in skills if s not in self._lookup))
+            if unknown:
+                nearest = (self.embedder.embed(unknown) @ self.centroids.T).argmax(axis=1)
+                self._lookup.update(zip(unknown, nearest.tolist()))
+            return np.array([self._lookup[s] for s in skills], dtype=np.int64)
+
+    def categorize(self, skills):
+        return [self.categories[i] for i in self.category_ids(skills)]
+
+    def thresholds(self, skills):
+        ids = self.category_ids(skills)
+        return self.tech_thresholds[ids], self.partial_thresholds[ids]
+
+    def category_match(self, skills, matched):
+        # Share of skills matched per category; nan where a category has none
+        ids = self.category_ids(skills)
+        n = len(self.categories)
+        totals = np.bincount(ids, minlength=n)
+        hits = np.bincount(ids, weights=np.asarray(matched, dtype=float), minlength=n)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            share = hits / totals
+        return dict(zip(self.categories, share))
+
+
+@lru_cache(maxsize=None)
+def get_category_index(embedder):
+    return SkillCategoryIndex(embedder)
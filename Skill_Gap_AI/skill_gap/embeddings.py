@@ -0,0 +1,100 @@
+# Model loading and cached, batched skill embeddings.
+#
+# Models and embedders are cached per model name, so every caller in the
+# process shares one copy of the weights and one embedding cache. A model
+# name may also be an offline artifact directory (see artifact.py); set
+# SKILL_GAP_ARTIFACT to make one the default. A relative SKILL_GAP_ARTIFACT
+# is resolved against the working directory at import time.
+
+import os
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+from .skills import normalize_skill
+
+HUB_MODEL_NAME = "all-MiniLM-L6-v2"
+ARTIFACT_PATH = os.environ.get("SKILL_GAP_ARTIFACT")
+if ARTIFACT_PATH:
+    ARTIFACT_PATH = os.path.abspath(os.path.expanduser(ARTIFACT_PATH))
+
+MODEL_NAME = ARTIFACT_PATH or HUB_MODEL_NAME
+
+
+def _is_artifact(name):
+    from .artifact import is_artifact
+
+    if is_artifact(name):
+        return True
+    # Never fall back to the hub when an artifact was asked for explicitly
+    if name == ARTIFACT_PATH:
+        raise FileNotFoundError(
+            f"SKILL_GAP_ARTIFACT points to {ARTIFACT_PATH}, which is not a model artifact "
+            "(no manifest.json); build one with: python -m skill_gap.artifact export <dir>"
+        )
+    return False
+
+
+# The public loaders resolve the default name before it reaches lru_cache,
+# so load_model() and load_model(MODEL_NAME) share one cache entry
+def load_model(name=None):
+    return _load_model(name or MODEL_NAME)
+
+
+@lru_cache(maxsize=None)
+def _load_model(name):
+    from .artifact import load_artifact
+
+    if _is_artifact(name):
+        return load_artifact(name).model
+
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(name)
+
+
+class SkillEmbedder:
+    def __init__(self, model, batch_size=64, name=None):
+        # name identifies the model for on-disk caches (see catalogue.py)
+        self.model = model
+        self.name = name
+        self.batch_size = batch_size
+        self.cache = {}
+        self._lock = threading.Lock()
+
+    @property
+    def dimension(self):
+        return self.model.get_sentence_embedding_dimension()
+
+    def embed(self, skills):
+        skills = [normalize_skill(s) for s in skills]
+        if not skills:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+
+        with self._lock:
+            # Only unseen skills go to the model, all in one batched call
+            new = list(dict.fromkeys(s for s in skills if s not in self.cache))
+            if new:
+                vectors = self.model.encode(
+                    new,
+                    batch_size=self.batch_size,
+                    normalize_embeddings=True,
+                    convert_to_numpy=True
+                )
+                self.cache.update(zip(new, vectors.astype(np.float32)))
+            return np.stack([self.cache[s] for s in skills])
+
+
+def get_embedder(name=None):
+    return _get_embedder(name or MODEL_NAME)
+
+
+@lru_cache(maxsize=None)
+def _get_embedder(name):
+    from .artifact import load_artifact
+
+    # Artifact embedders start with the precomputed taxonomy in their cache
+    if _is_artifact(name):
+        return load_artifact(name).embedder
+    return SkillEmbedder(load_model(name), name=name)
@@ -0,0 +1,72 @@
+# Format-aware text extraction for uploaded resumes and job descriptions.
+#
+# Accepts raw bytes (or a file-like object) plus the original file name, so
+# it can run in a background thread after the upload has been read.
+
+import io
+import os
+
+SUPPORTED_FORMATS = ["pdf", "docx", "txt"]
+
+
+def file_format(name):
+    return os.path.splitext(name)[1].lower().lstrip(".")
+
+
+def _report(progress, done, total):
+    if progress is not None:
+        progress(done, total)
+
+
+def _as_stream(data):
+    return io.BytesIO(data) if isinstance(data, (bytes, bytearray)) else data
+
+
+def _pdf_text(data, progress):
+    import pdfplumber
+
+    with pdfplumber.open(_as_stream(data)) as pdf:
+        pages = []
+        total = len(pdf.pages)
+        for i, page in enumerate(pdf.pages, 1):
+            pages.append(page.extract_text() or "")
+            _report(progress, i, total)
+    return " ".join(p for p in pages if p)
+
+
+def _docx_text(data, progress):
+    import docx
+
+    doc = docx.Document(_as_stream(data))
+    text = " ".join(p.text for p in doc.paragraphs)
+    _report(progress, 1, 1)
+    return text
+
+
+def _txt_text(data, progress):
+    if not isinstance(data, (bytes, bytearray)):
+        data = data.read()
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        text = data.decode("latin-1")
+    _report(progress, 1, 1)
+    return text
+
+
+EXTRACTORS = {
+    "pdf": _pdf_text,
+    "docx": _docx_text,
+    "txt": _txt_text
+}
+
+
+def extract_text(data, name, progress=None):
+    fmt = file_format(name)
+    if fmt not in EXTRACTORS:
+        raise ValueError(f"Unsupported file format: {name}")
+
+    text = EXTRACTORS[fmt](data, progress)
+    if not text.strip():
+        raise ValueError(f"No text could be extracted from {name}")
+    return text
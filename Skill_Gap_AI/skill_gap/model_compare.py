@@ -0,0 +1,132 @@
+# Side-by-side comparison of Sentence-BERT models on one skill gap task.
+#
+# model_names may be hub names, which need network access, or offline
+# artifact directories (see artifact.py) for comparisons on offline hosts.
+#
+# Every model gets its own embedder (and so its own cache) and encodes the
+# unique skills exactly once. Models are loaded in parallel on a thread pool
+# and warmed up with one throwaway encode, so lazy tokenizer/kernel setup is
+# not timed. Encoding is then timed one model at a time by default
+# (sequential_timing=False times them concurrently, faster but contended).
+# Load time is not reported: cached or pre-warmed models would make it
+# meaningless as a cost comparison.
+# The agreement report compares each model with the first (baseline) one:
+#   - classification flips: JD skills whose matched/partial/missing label differs,
+#     using the same (optionally per-category) thresholds for every model
+#   - rank correlation: Spearman correlation of the resume skill ranking per
+#     JD skill (the ordering best_matches() reads from), averaged
+#   - top-1 agreement: share of JD skills with the same best resume skill
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .embeddings import MODEL_NAME, SkillEmbedder, load_model
+from .scoring import best_matches, classify_skills, similarity_dataframe, skill_thresholds
+from .skills import clean_skills
+
+COMPARE_MODELS = [MODEL_NAME, "paraphrase-MiniLM-L12-v2"]
+
+
+def _labels(df, thresholds):
+    matched, partial, missing = classify_skills(df, *thresholds)
+    labels = {s: "matched" for s in matched}
+    labels.update({s: "partial" for s in partial})
+    labels.update({s: "missing" for s in missing})
+    return pd.Series(labels).reindex(df.columns)
+
+
+def _load_warm(name):
+    model = load_model(name)
+    model.encode(["warmup"], convert_to_numpy=True)
+    return SkillEmbedder(model, name=name)
+
+
+def _timed_encode(embedder, skills):
+    start = time.perf_counter()
+    embedder.embed(skills)
+    return time.perf_counter() - start
+
+
+def _run_model(name, embedder, encode_s, resume_skills, jd_skills, top_n, thresholds):
+    # Everything here is served from this model's cache
+    df = similarity_dataframe(resume_skills, jd_skills, embedder)
+    return {
+        "model": name,
+        "encode_s": encode_s,
+        "encode_ms_per_skill": encode_s * 1000 / len(set(resume_skills + jd_skills)),
+        "similarity_matrix": df,
+        "labels": _labels(df, thresholds),
+        "best_matches": best_matches(df, top_n),
+        "alignment_score": float(df.max(axis=0).mean()) if not df.empty else 0.0
+    }
+
+
+def _agreement(base, other):
+    flips = base["labels"] != other["labels"]
+    flipped = [
+        {"skill": s, base["model"]: base["labels"][s], other["model"]: other["labels"][s]}
+        for s in base["labels"].index[flips]
+    ]
+
+    a, b = base["similarity_matrix"], other["similarity_matrix"]
+    rank_corr = a.rank().corrwith(b.rank()) if len(a.index) > 1 else pd.Series(dtype=float)
+    top1 = (a.idxmax() == b.idxmax()) if not a.empty else pd.Series(dtype=bool)
+
+    return {
+        "baseline": base["model"],
+        "model": other["model"],
+        "classification_flips": flipped,
+        "flip_rate": float(flips.mean()),
+        "rank_correlation": float(np.nanmean(rank_corr)) if rank_corr.notna().any() else float("nan"),
+        "top1_agreement": float(top1.mean()) if len(top1) else float("nan")
+    }
+
+
+def compare_models(resume_skills, jd_skills, model_names=COMPARE_MODELS, top_n=3, max_workers=None,
+                   category_index=None, sequential_timing=True):
+    resume_skills = clean_skills(resume_skills)
+    jd_skills = clean_skills(jd_skills)
+    if not resume_skills or not jd_skills:
+        return {"error": "Empty skill list provided"}
+
+    # Computed once, so every model is classified by the same rule
+    thresholds = skill_thresholds(jd_skills, category_index)
+
+    unique = list(dict.fromkeys(resume_skills + jd_skills))
+    with ThreadPoolExecutor(max_workers=max_workers or len(model_names)) as pool:
+        embedders = list(pool.map(_load_warm, model_names))
+        if sequential_timing:
+            encode_times = [_timed_encode(e, unique) for e in embedders]
+        else:
+            encode_times = list(pool.map(lambda e: _timed_encode(e, unique), embedders))
+
+    runs = [
+        _run_model(name, embedder, encode_s, resume_skills, jd_skills, top_n, thresholds)
+        for name, embedder, encode_s in zip(model_names, embedders, encode_times)
+    ]
+
+    base = runs[0]
+    return {
+        "models": {run["model"]: run for run in runs},
+        "agreement": [_agreement(base, other) for other in runs[1:]]
+    }
+
+
+def comparison_table(comparison):
+    agreement = {a["model"]: a for a in comparison["agreement"]}
+    rows = []
+    for name, run in comparison["models"].items():
+        a = agreement.get(name, {})
+        rows.append({
+            "Model": name,
+            "Encode (s)": round(run["encode_s"], 3),
+            "Encode (ms/skill)": round(run["encode_ms_per_skill"], 3),
+            "Alignment": round(run["alignment_score"], 3),
+            "Flips vs Baseline": len(a.get("classification_flips", [])),
+            "Rank Correlation": round(a.get("rank_correlation", 1.0), 3),
+            "Top-1 Agreement": round(a.get("top1_agreement", 1.0), 3)
+        })
+    return pd.DataFrame(rows)
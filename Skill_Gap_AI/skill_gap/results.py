@@ -0,0 +1,190 @@
+# Compact skill gap results for keeping many analyses in memory.
+#
+# A SkillGapResult holds int32 skill ids into a shared SkillVocab, the float32
+# similarity matrix and two int bitmasks (bit i = JD skill i) for the matched
+# and partially matched categories; everything else is missing. DataFrames,
+# report dicts and JSON are only built on demand via the to_* methods.
+
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .scoring import PARTIAL_THRESHOLD, TECH_THRESHOLD, classify_scores, skill_thresholds
+from .skills import clean_skills
+
+
+class SkillVocab:
+    # Safe to share between threads; only new ids are assigned under the lock
+    __slots__ = ("skills", "_ids", "_lock")
+
+    def __init__(self, skills=()):
+        self.skills = []
+        self._ids = {}
+        self._lock = threading.Lock()
+        self.ids(skills)
+
+    def __len__(self):
+        return len(self.skills)
+
+    def __getitem__(self, skill_id):
+        return self.skills[skill_id]
+
+    def _add(self, skill):
+        skill_id = self._ids.get(skill)
+        if skill_id is None:
+            # Append first: an id must never be visible to the lock-free
+            # readers before its name is
+            self.skills.append(skill)
+            skill_id = self._ids[skill] = len(self.skills) - 1
+        return skill_id
+
+    def id(self, skill):
+        skill_id = self._ids.get(skill)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._add(skill)
+        return skill_id
+
+    def ids(self, skills):
+        skills = list(skills)
+        if all(s in self._ids for s in skills):
+            return np.array([self._ids[s] for s in skills], dtype=np.int32)
+        with self._lock:
+            return np.array([self._add(s) for s in skills], dtype=np.int32)
+
+    def names(self, skill_ids):
+        return [self.skills[i] for i in skill_ids]
+
+
+def _to_bits(mask):
+    return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+
+def _from_bits(bits, n):
+    raw = np.frombuffer(bits.to_bytes((n + 7) // 8, "little"), dtype=np.uint8)
+    return np.unpackbits(raw, count=n, bitorder="little").astype(bool)
+
+
+class SkillGapResult:
+    __slots__ = ("vocab", "resume_ids", "jd_ids", "similarity", "matched_bits",
+                 "partial_bits", "alignment_score")
+
+    def __init__(self, vocab, resume_ids, jd_ids, similarity, matched_bits, partial_bits,
+                 alignment_score):
+        self.vocab = vocab
+        self.resume_ids = resume_ids
+        self.jd_ids = jd_ids
+        self.similarity = similarity
+        self.matched_bits = matched_bits
+        self.partial_bits = partial_bits
+        self.alignment_score = alignment_score
+
+    @classmethod
+    def from_scores(cls, vocab, resume_skills, jd_skills, similarity,
+                    tech_threshold=TECH_THRESHOLD, partial_threshold=PARTIAL_THRESHOLD):
+        similarity = np.asarray(similarity, dtype=np.float32).reshape(len(resume_skills), len(jd_skills))
+        best = similarity.max(axis=0) if len(resume_skills) else np.zeros(len(jd_skills), np.float32)
+        matched, partial = classify_scores(best, tech_threshold, partial_threshold)
+        return cls(
+            vocab,
+            vocab.ids(resume_skills),
+            vocab.ids(jd_skills),
+            similarity,
+            _to_bits(matched),
+            _to_bits(partial),
+            float(best.mean()) if len(best) else 0.0
+        )
+
+    @classmethod
+    def from_pipeline(cls, vocab, result):
+        df = result["similarity_matrix"]
+        report = result["skill_gap_report"]
+        jd_skills = list(df.columns)
+        return cls(
+            vocab,
+            vocab.ids(df.index),
+            vocab.ids(jd_skills),
+            df.to_numpy(dtype=np.float32),
+            _to_bits(np.isin(jd_skills, report["matched_skills"])),
+            _to_bits(np.isin(jd_skills, report["partially_matched_skills"])),
+            float(result["alignment_score"])
+        )
+
+    # ---------------- LAZY VIEWS ----------------
+    @property
+    def best_scores(self):
+        if not len(self.resume_ids):
+            return np.zeros(len(self.jd_ids), dtype=np.float32)
+        return self.similarity.max(axis=0)
+
+    def _category(self, bits):
+        return self.vocab.names(self.jd_ids[_from_bits(bits, len(self.jd_ids))])
+
+    def category_masks(self):
+        # (matched, partial) boolean arrays in JD skill order
+        n = len(self.jd_ids)
+        return _from_bits(self.matched_bits, n), _from_bits(self.partial_bits, n)
+
+    @property
+    def matched_skills(self):
+        return self._category(self.matched_bits)
+
+    @property
+    def partial_skills(self):
+        return self._category(self.partial_bits)
+
+    @property
+    def missing_skills(self):
+        everything = (1 << len(self.jd_ids)) - 1
+        return self._category(everything & ~(self.matched_bits | self.partial_bits))
+
+    def to_dataframe(self):
+        return pd.DataFrame(
+            self.similarity,
+            index=self.vocab.names(self.resume_ids),
+            columns=self.vocab.names(self.jd_ids)
+        )
+
+    def to_report(self):
+        return {
+            "matched_skills": self.matched_skills,
+            "partially_matched_skills": self.partial_skills,
+            "missing_skills": self.missing_skills
+        }
+
+    def to_scores_table(self):
+        matched, partial = self.category_masks()
+        status = np.where(matched, "Matched", np.where(partial, "Partial", "Missing"))
+        return pd.DataFrame({
+            "Skill": self.vocab.names(self.jd_ids),
+            "Similarity Score": self.best_scores.round(2),
+            "Status": status
+        })
+
+    def to_dict(self):
+        # Same shape as skill_gap_pipeline() output
+        return {
+            "similarity_matrix": self.to_dataframe(),
+            "skill_gap_report": self.to_report(),
+            "alignment_score": self.alignment_score
+        }
+
+    def to_json(self, **kwargs):
+        return json.dumps({
+            "skill_gap_report": self.to_report(),
+            "alignment_score": self.alignment_score
+        }, **kwargs)
+
+
+def compact_pipeline(resume_skills, jd_skills, embedder, vocab, category_index=None):
+    resume_skills = clean_skills(resume_skills)
+    jd_skills = clean_skills(jd_skills)
+    if not jd_skills:
+        raise ValueError("Empty skill list provided")
+
+    similarity = embedder.embed(resume_skills) @ embedder.embed(jd_skills).T
+    return SkillGapResult.from_scores(
+        vocab, resume_skills, jd_skills, similarity, *skill_thresholds(jd_skills, category_index)
+    )
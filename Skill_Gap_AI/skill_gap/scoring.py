@@ -0,0 +1,74 @@
+# Similarity scoring, classification and skill gap reports.
+
+import numpy as np
+import pandas as pd
+
+from .skills import clean_skills
+
+TECH_THRESHOLD = 0.75
+PARTIAL_THRESHOLD = 0.5
+
+
+def similarity_dataframe(resume_skills, jd_skills, embedder):
+    # Embeddings are L2-normalized, so the dot product is the cosine similarity
+    resume_emb = embedder.embed(resume_skills)
+    jd_emb = embedder.embed(jd_skills)
+    return pd.DataFrame(resume_emb @ jd_emb.T, index=resume_skills, columns=jd_skills)
+
+
+def best_matches(df, top_n=3):
+    scores = df.to_numpy()
+    order = np.argsort(-scores, axis=0, kind="stable")[:top_n]
+    return {
+        jd: {df.index[i]: float(scores[i, j]) for i in order[:, j]}
+        for j, jd in enumerate(df.columns)
+    }
+
+
+def best_scores(df):
+    if df.empty:
+        return pd.Series(0.0, index=df.columns)
+    return df.max(axis=0)
+
+
+def skill_thresholds(jd_skills, category_index=None):
+    # Scalars when no category index is given, else one threshold per JD skill
+    if category_index is None:
+        return TECH_THRESHOLD, PARTIAL_THRESHOLD
+    return category_index.thresholds(jd_skills)
+
+
+def classify_scores(scores, tech_threshold=TECH_THRESHOLD, partial_threshold=PARTIAL_THRESHOLD):
+    matched = scores >= tech_threshold
+    partial = ~matched & (scores >= partial_threshold)
+    return matched, partial
+
+
+def classify_skills(df, tech_threshold=TECH_THRESHOLD, partial_threshold=PARTIAL_THRESHOLD):
+    matched, partial = classify_scores(best_scores(df), tech_threshold, partial_threshold)
+    missing = ~matched & ~partial
+    return list(df.columns[matched]), list(df.columns[partial]), list(df.columns[missing])
+
+
+def skill_gap_report(df, tech_threshold=TECH_THRESHOLD, partial_threshold=PARTIAL_THRESHOLD):
+    matched, partial, missing = classify_skills(df, tech_threshold, partial_threshold)
+    return {
+        "matched_skills": matched,
+        "partially_matched_skills": partial,
+        "missing_skills": missing
+    }
+
+
+def skill_gap_pipeline(resume_skills, jd_skills, embedder, category_index=None):
+    resume_skills = clean_skills(resume_skills)
+    jd_skills = clean_skills(jd_skills)
+    if not jd_skills:
+        return {"error": "Empty skill list provided"}
+
+    df = similarity_dataframe(resume_skills, jd_skills, embedder)
+
+    return {
+        "similarity_matrix": df,
+        "skill_gap_report": skill_gap_report(df, *skill_thresholds(jd_skills, category_index)),
+        "alignment_score": float(best_scores(df).mean())
+    }
@@ -0,0 +1,179 @@
+# Process-pool sharded execution of skill_gap_pipeline for multi-core hosts.
+#
+# The parent embeds the skill vocabulary once and places the table in shared
+# memory. Each worker attaches to it at start-up and seeds its embedder cache
+# with read-only views into that block, so no vectors are pickled per task.
+# Skills outside the table are encoded by the worker's own model, loaded at
+# most once per worker. Workloads are split into contiguous shards and
+# results come back in input order.
+#
+#   with ShardedExecutor(vocab, workers=8, threads_per_worker=4) as ex:
+#       results = ex.map(workloads)   # [(resume_skills, jd_skills), ...]
+
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from .embeddings import MODEL_NAME, SkillEmbedder, get_embedder, load_model
+from .scoring import skill_gap_pipeline
+from .skills import clean_skills
+
+THREAD_ENV_VARS = [
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS"
+]
+
+_worker = {}
+
+
+# ---------------- WORKER ----------------
+class _LazyModel:
+    # Defers loading weights until a skill is missing from the shared table
+    def __init__(self, name, threads, dimension):
+        self.name = name
+        self.threads = threads
+        self.dimension = dimension
+        self._model = None
+
+    def _load(self):
+        if self._model is None:
+            import torch
+
+            torch.set_num_threads(self.threads)
+            self._model = load_model(self.name)
+        return self._model
+
+    def get_sentence_embedding_dimension(self):
+        return self.dimension
+
+    def encode(self, *args, **kwargs):
+        return self._load().encode(*args, **kwargs)
+
+
+def _limit_threads(threads):
+    # BLAS pools are sized from the env inherited at spawn (see _thread_env);
+    # threadpoolctl, when installed, additionally caps them at runtime
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return
+    _worker["threadpool_limits"] = threadpool_limits(threads)
+
+
+def _init_worker(shm_name, shape, vocab, model_name, threads):
+    _limit_threads(threads)
+
+    shm = SharedMemory(name=shm_name)
+    table = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+    table.flags.writeable = False
+
+    embedder = SkillEmbedder(_LazyModel(model_name, threads, shape[1]))
+    embedder.cache.update(zip(vocab, table))
+    _worker.update(shm=shm, embedder=embedder)
+
+
+def _ready():
+    return os.getpid()
+
+
+def _run_shard(shard):
+    embedder = _worker["embedder"]
+    return [skill_gap_pipeline(resume, jd, embedder) for resume, jd in shard]
+
+
+# ---------------- EXECUTOR ----------------
+@contextmanager
+def _thread_env(threads):
+    # A spawned worker imports numpy while unpickling its initializer, so the
+    # thread caps must already be in the environment it inherits
+    saved = {var: os.environ.get(var) for var in THREAD_ENV_VARS}
+    os.environ.update({var: str(threads) for var in THREAD_ENV_VARS})
+    try:
+        yield
+    finally:
+        for var, value in saved.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+
+
+def _partition(items, n_shards):
+    n_shards = max(1, min(n_shards, len(items)))
+    bounds = np.linspace(0, len(items), n_shards + 1).astype(int)
+    return [items[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+def workload_vocab(workloads):
+    return clean_skills(s for resume, jd in workloads for s in list(resume) + list(jd))
+
+
+class ShardedExecutor:
+    def __init__(self, vocab, model_name=MODEL_NAME, workers=None, threads_per_worker=None,
+                 embeddings=None):
+        cpus = os.cpu_count() or 1
+        self.vocab = clean_skills(vocab)
+        self.model_name = model_name
+        self.workers = workers or cpus
+        self.threads_per_worker = threads_per_worker or max(1, cpus // self.workers)
+        self._embeddings = embeddings
+        self._shm = None
+        self._pool = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def start(self):
+        table = self._embeddings
+        if table is None:
+            table = get_embedder(self.model_name).embed(self.vocab)
+        table = np.ascontiguousarray(table, dtype=np.float32)
+
+        self._shm = SharedMemory(create=True, size=max(table.nbytes, 1))
+        np.ndarray(table.shape, dtype=np.float32, buffer=self._shm.buf)[:] = table
+
+        # spawn, not fork: forking a parent with live torch/BLAS threads can deadlock
+        with _thread_env(self.threads_per_worker):
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._shm.name, table.shape, self.vocab, self.model_name,
+                          self.threads_per_worker)
+            )
+            # Workers are spawned on demand; start all of them now, while the
+            # capped environment is in place
+            wait([self._pool.submit(_ready) for _ in range(self.workers)])
+
+    def map(self, workloads, shards_per_worker=4):
+        workloads = list(workloads)
+        if not workloads:
+            return []
+        shards = _partition(workloads, self.workers * shards_per_worker)
+        return [r for shard in self._pool.map(_run_shard, shards) for r in shard]
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+def run_sharded(workloads, model_name=MODEL_NAME, workers=None, threads_per_worker=None):
+    workloads = list(workloads)
+    with ShardedExecutor(workload_vocab(workloads), model_name, workers, threads_per_worker) as ex:
+        return ex.map(workloads)
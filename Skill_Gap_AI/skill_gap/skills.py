@@ -0,0 +1,43 @@
+# Skill cleaning, normalization and lookup in free text.
+
+import re
+
+ABBREVIATIONS = {
+    "ml": "machine learning",
+    "dl": "deep learning",
+    "ai": "artificial intelligence"
+}
+
+DEFAULT_SKILLS = [
+    "python", "sql", "machine learning", "data analysis",
+    "flask", "django", "aws", "excel", "communication"
+]
+
+
+def normalize_text(text):
+    return " ".join(text.lower().split())
+
+
+def normalize_skill(skill):
+    skill = normalize_text(skill)
+    return ABBREVIATIONS.get(skill, skill)
+
+
+def clean_skills(skills):
+    return list(dict.fromkeys(normalize_skill(s) for s in skills if s.strip()))
+
+
+def skill_pattern(skills):
+    # Longest skills first so "machine learning" wins over "learning"
+    alternatives = "|".join(re.escape(s) for s in sorted(skills, key=len, reverse=True))
+    return re.compile(rf"(?<!\w)(?:{alternatives})(?!\w)")
+
+
+def find_skills(text, skills=DEFAULT_SKILLS):
+    # Whole-word lookup, so "sql" is not found inside "nosql"; abbreviations
+    # such as "ML" count towards the skill they expand to.
+    skills = clean_skills(skills)
+    aliases = [a for a, s in ABBREVIATIONS.items() if s in skills]
+    matches = skill_pattern(skills + aliases).findall(normalize_text(text))
+    found = {normalize_skill(m) for m in matches}
+    return [s for s in skills if s in found]